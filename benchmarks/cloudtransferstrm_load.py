@@ -0,0 +1,171 @@
+"""
+CloudTransferStrm 离线压测
+
+使用 moviepilot_stubs 中的替身加载插件，向临时目录回放合成的 TransferComplete 事件，
+输出事件吞吐、处理延迟p99、每事件文件系统操作数和每事件Emby请求数。
+文件系统操作数通过 sys.addaudithook 统计（open/mkdir/rename/remove/chmod 等审计事件，不含stat）。
+处理延迟为单个事件生成strm及通知Emby的执行耗时；端到端延迟额外包含在调度队列中的等待时间，
+事件一次性全部分发，端到端延迟主要反映队列积压。
+开启Emby刷新时，插件在每次合并提交实时写入后等待0.1秒再统一通知，等待不计入单个事件的处理延迟。
+文件系统操作和Emby请求统计到 stop_service 完成最后一次提交和通知为止。
+
+用法: python benchmarks/cloudtransferstrm_load.py [--events 5000] [--mappings 200] [--refresh-emby] [--write-mode atomic]
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import moviepilot_stubs  # noqa: E402
+
+FS_AUDIT_EVENTS = {
+    "open",
+    "os.mkdir",
+    "os.rename",
+    "os.remove",
+    "os.chmod",
+    "os.listdir",
+    "os.scandir",
+    "os.truncate",
+}
+
+
+class FsOpCounter:
+    """
+    统计当前进程的文件系统操作，只在enabled时计数
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.enabled = False
+        sys.addaudithook(self.__hook)
+
+    def __hook(self, event, args):
+        if self.enabled and event in FS_AUDIT_EVENTS:
+            self.count += 1
+
+
+def make_paths(events: int, mappings: int, seed: int):
+    """
+    生成合成的入库文件路径，分布在多个映射和剧集目录中
+    """
+    rng = random.Random(seed)
+    exts = [".mkv", ".mp4", ".ts"]
+    for i in range(events):
+        mapping = rng.randrange(mappings)
+        show = rng.randrange(50)
+        season = rng.randrange(1, 6)
+        yield (
+            f"/cloud/lib{mapping:04d}/Show {show:03d}/Season {season:02d}/"
+            f"Show {show:03d} - S{season:02d}E{i:05d}{rng.choice(exts)}"
+        )
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, int(round(pct / 100 * len(values))) - 1))
+    return values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CloudTransferStrm 离线压测")
+    parser.add_argument("--events", type=int, default=5000, help="回放的事件数")
+    parser.add_argument("--mappings", type=int, default=200, help="目录映射数")
+    parser.add_argument("--refresh-emby", action="store_true", help="开启Emby刷新通知")
+    parser.add_argument("--write-mode", default="atomic", help="strm写入模式 direct/atomic/durable")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    args = parser.parse_args()
+
+    moviepilot_stubs.install()
+    fs_counter = FsOpCounter()
+    plugin_module = moviepilot_stubs.load_plugin("plugins.v2/cloudtransferstrm")
+    Event = moviepilot_stubs.Event
+    EventType = moviepilot_stubs.EventType
+
+    work_dir = tempfile.mkdtemp(prefix="cloudtransferstrm-load-")
+    try:
+        with moviepilot_stubs.EmbyStub() as emby:
+            moviepilot_stubs.MediaServerHelper.emby_host = emby.host
+            monitor_confs = "\n".join(
+                f"/cloud/lib{i:04d}#{work_dir}/strm/lib{i:04d}#https://alist.example/d"
+                for i in range(args.mappings)
+            )
+            plugin = plugin_module.CloudTransferStrm()
+            plugin.init_plugin(
+                {
+                    "enabled": True,
+                    "refresh_emby": args.refresh_emby,
+                    "write_mode": args.write_mode,
+                    "monitor_confs": monitor_confs,
+                }
+            )
+
+            # 包装实时任务，记录执行耗时和从分发到完成的耗时
+            latencies = []
+            e2e_latencies = []
+            done = threading.Semaphore(0)
+            scheduler = plugin._job_scheduler
+            submit_live = scheduler.submit_live
+
+            def timed_submit(name, func, *func_args, **func_kwargs):
+                dispatched = time.perf_counter()
+
+                def run():
+                    started = time.perf_counter()
+                    try:
+                        func(*func_args, **func_kwargs)
+                    finally:
+                        finished = time.perf_counter()
+                        latencies.append(finished - started)
+                        e2e_latencies.append(finished - dispatched)
+                        done.release()
+
+                submit_live(name, run)
+
+            scheduler.submit_live = timed_submit
+
+            events = [
+                Event(
+                    EventType.TransferComplete,
+                    {"transferinfo": SimpleNamespace(target_item=SimpleNamespace(path=path))},
+                )
+                for path in make_paths(args.events, args.mappings, args.seed)
+            ]
+
+            fs_counter.enabled = True
+            start = time.perf_counter()
+            for event in events:
+                plugin.transfer_complete(event)
+            for _ in events:
+                done.acquire()
+            elapsed = time.perf_counter() - start
+            # stop_service会提交剩余的暂存文件并通知Emby，计入统计
+            plugin.stop_service()
+            fs_counter.enabled = False
+
+            strm_files = sum(len(files) for _, _, files in os.walk(os.path.join(work_dir, "strm")))
+            print(f"事件数:            {len(events)}")
+            print(f"映射数:            {args.mappings}")
+            print(f"写入模式:          {args.write_mode}")
+            print(f"生成strm文件数:    {strm_files}")
+            print(f"事件吞吐:          {len(events) / elapsed:.1f} events/s")
+            print(f"处理延迟p50:       {percentile(latencies, 50) * 1000:.2f} ms")
+            print(f"处理延迟p99:       {percentile(latencies, 99) * 1000:.2f} ms")
+            print(f"端到端延迟p99:     {percentile(e2e_latencies, 99) * 1000:.2f} ms")
+            print(f"每事件文件系统操作: {fs_counter.count / len(events):.2f}")
+            print(f"每事件Emby请求:    {emby.requests / len(events):.2f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
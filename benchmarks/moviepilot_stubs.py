@@ -0,0 +1,222 @@
+"""
+MoviePilot运行环境的轻量替身，用于在没有完整MoviePilot安装的情况下加载插件做基准测试
+
+install() 会向 sys.modules 注册以下模块的最小实现：
+app.core.config(settings)、app.core.event(eventmanager, Event)、app.log(logger)、
+app.plugins(_PluginBase)、app.schemas.types(EventType, NotificationType)、
+app.helper.mediaserver(MediaServerHelper)、app.utils.http(RequestUtils)
+EmbyStub 是本地HTTP服务，记录收到的请求数，MediaServerHelper 的 Emby 实例会把请求发到这里
+"""
+import importlib.util
+import logging
+import sys
+import threading
+import time
+import types
+import urllib.request
+from enum import Enum
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+class EventType(Enum):
+    TransferComplete = "transfer.complete"
+    NoticeMessage = "notice.message"
+
+
+class NotificationType(Enum):
+    Download = "资源下载"
+    Organize = "整理入库"
+    Manual = "手动处理"
+
+
+class RequestUtils:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def post_res(self, url: str, data=None, **kwargs):
+        return None
+
+
+class Event:
+    def __init__(self, event_type: EventType, event_data: dict = None):
+        self.event_type = event_type
+        self.event_data = event_data or {}
+
+
+class EventManager:
+    @staticmethod
+    def register(etype):
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+class PluginBase:
+    """
+    _PluginBase 替身，插件数据保存在内存中
+    """
+
+    def __init__(self):
+        self._data = {}
+        self.systemmessage = SimpleNamespace(put=lambda *args, **kwargs: None)
+
+    def get_data(self, key: str = None):
+        return self._data.get(key)
+
+    def save_data(self, key: str, value):
+        self._data[key] = value
+
+    def update_config(self, config: dict, plugin_id: str = None):
+        self._config = config
+        return True
+
+
+class EmbyStub:
+    """
+    本地Emby HTTP替身，所有请求返回204并计数
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                with stub._lock:
+                    stub.requests += 1
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.host = f"http://127.0.0.1:{self._server.server_address[1]}/"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._server.shutdown()
+        self._server.server_close()
+        return False
+
+
+class EmbyInstance:
+    def __init__(self, host: str, apikey: str):
+        self._host = host
+        self._apikey = apikey
+
+    @staticmethod
+    def get_user():
+        return "stub"
+
+    def post_data(self, url: str, data: str = None, headers: dict = None):
+        url = url.replace("[HOST]", self._host).replace("[APIKEY]", self._apikey)
+        req = urllib.request.Request(
+            url, data=(data or "").encode("utf-8"), headers=headers or {}, method="POST"
+        )
+        with urllib.request.urlopen(req, timeout=10) as res:
+            return SimpleNamespace(status_code=res.status)
+
+
+class MediaServerHelper:
+    """
+    MediaServerHelper 替身，emby_host为空时表示未配置媒体服务器
+    真实的 MediaServerHelper 创建时会读取媒体服务器配置并初始化各服务实例，
+    construct_cost_ms 用于模拟这部分耗时
+    """
+
+    emby_host = None
+    instances = 0
+    construct_cost_ms = 0
+
+    def __init__(self):
+        MediaServerHelper.instances += 1
+        if self.construct_cost_ms:
+            time.sleep(self.construct_cost_ms / 1000)
+
+    def get_services(self, type_filter: str = None, name_filters=None):
+        if not self.emby_host or type_filter not in (None, "emby"):
+            return {}
+        config = {"host": self.emby_host, "apikey": "stub"}
+        return {
+            "emby": SimpleNamespace(
+                instance=EmbyInstance(self.emby_host, "stub"),
+                config=SimpleNamespace(config=config),
+            )
+        }
+
+
+def _module(name: str, **attrs) -> types.ModuleType:
+    module = sys.modules.get(name) or types.ModuleType(name)
+    module.__dict__.update(attrs)
+    if "." not in name:
+        module.__path__ = []
+    sys.modules[name] = module
+    return module
+
+
+def install(log_level: int = logging.WARNING):
+    """
+    注册MoviePilot模块替身
+    """
+    logger = logging.getLogger("moviepilot-stub")
+    logger.setLevel(log_level)
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
+    for package in ("app", "app.core", "app.helper", "app.schemas", "app.utils"):
+        _module(package, __path__=[])
+    _module(
+        "app.core.config",
+        settings=SimpleNamespace(RMT_MEDIAEXT=[".mp4", ".mkv", ".ts", ".iso", ".rmvb", ".avi", ".strm"]),
+    )
+    _module("app.core.event", eventmanager=EventManager(), Event=Event)
+    _module("app.log", logger=logger)
+    _module("app.plugins", _PluginBase=PluginBase, __path__=[])
+    _module("app.schemas.types", EventType=EventType, NotificationType=NotificationType)
+    _module("app.utils.http", RequestUtils=RequestUtils)
+    _module("app.helper.mediaserver", MediaServerHelper=MediaServerHelper)
+
+
+def install_crypto() -> bool:
+    """
+    未安装 pycryptodome 时注册 Crypto 模块替身，使旧版本插件可以加载
+    替身没有导入开销，已安装时不提前导入，由插件导入时计入真实耗时
+    :return: 是否使用了替身
+    """
+    if importlib.util.find_spec("Crypto") is not None:
+        return False
+    _module("Crypto", __path__=[])
+    _module("Crypto.Cipher", __path__=[], AES=SimpleNamespace(MODE_CBC=2, new=None))
+    _module("Crypto.Util", __path__=[])
+    _module("Crypto.Util.Padding", pad=lambda data, block_size: data)
+    return True
+
+
+def load_plugin(relative_dir: str, repo_dir: Path = REPO_DIR):
+    """
+    按目录加载插件包，支持插件内的相对导入
+    :param relative_dir: 相对仓库根目录的插件目录，如 plugins.v2/cloudtransferstrm
+    :param repo_dir: 仓库根目录，可指向导出的其他版本
+    """
+    plugin_dir = Path(repo_dir) / relative_dir
+    name = f"app.plugins.{plugin_dir.name}"
+    sys.modules.pop(name, None)
+    spec = importlib.util.spec_from_file_location(
+        name, plugin_dir / "__init__.py", submodule_search_locations=[str(plugin_dir)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,196 @@
+"""
+插件加载耗时基准测试
+
+每次在新的Python进程中使用 moviepilot_stubs 加载插件，统计模块导入耗时、新增导入的模块数、
+init_plugin 耗时以及 init_plugin 期间创建的 MediaServerHelper 数量，取多次运行的中位数。
+MediaServerHelper 替身按 --helper-cost-ms 模拟创建耗时（真实环境需读取配置并初始化媒体服务器实例），
+这是人为设定的值，init耗时中的这部分差异只说明创建次数的变化，实际节省取决于真实环境，--helper-cost-ms 0 可排除。
+默认使用预热后的字节码缓存（缓存目录在临时目录，不写入仓库），--cold 测试无缓存时的加载。
+指定 --baseline 时会从git导出该版本的插件目录一并测试，便于对比。
+已安装 pycryptodome 时，导入耗时包含真实的 Crypto.Cipher 导入；
+未安装时旧版本使用没有开销的 Crypto 替身加载，导入耗时不含 pycryptodome，会输出警告。
+
+用法: python benchmarks/plugin_startup_bench.py [--repeat 10] [--baseline HEAD~1] [--helper-cost-ms 30] [--cold]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import moviepilot_stubs  # noqa: E402
+
+# (插件目录, 插件类名, [(场景名称, 配置)])
+PLUGINS = [
+    (
+        "plugins/serverchan3msg",
+        "ServerChan3Msg",
+        [
+            ("未启用", {"enabled": False}),
+            ("已启用", {"enabled": True, "serverchan_key": "key", "serverchan_uid": "1"}),
+        ],
+    ),
+    (
+        "plugins.v2/cloudtransferstrm",
+        "CloudTransferStrm",
+        [
+            ("未启用", {"enabled": False}),
+            (
+                "已启用-不刷新Emby",
+                {"enabled": True, "refresh_emby": False, "monitor_confs": "/cloud#/strm#http://alist/d"},
+            ),
+        ],
+    ),
+]
+
+
+def child(repo_dir: str, relative_dir: str, class_name: str, helper_cost_ms: str):
+    """
+    子进程：加载一次插件并输出各项耗时
+    """
+    moviepilot_stubs.install()
+    moviepilot_stubs.MediaServerHelper.construct_cost_ms = float(helper_cost_ms)
+    crypto_stub = moviepilot_stubs.install_crypto()
+    modules_before = len(sys.modules)
+    start = time.perf_counter()
+    module = moviepilot_stubs.load_plugin(relative_dir, repo_dir)
+    result = {
+        "import_ms": (time.perf_counter() - start) * 1000,
+        "modules": len(sys.modules) - modules_before,
+        # 只有插件实际导入了 Crypto 才标记使用了替身
+        "crypto_stub": crypto_stub and hasattr(module, "AES"),
+        "init": {},
+    }
+    plugin_cls = getattr(module, class_name)
+    for scenario, config in next(p[2] for p in PLUGINS if p[0] == relative_dir):
+        helpers_before = moviepilot_stubs.MediaServerHelper.instances
+        plugin = plugin_cls()
+        start = time.perf_counter()
+        plugin.init_plugin(config)
+        elapsed = (time.perf_counter() - start) * 1000
+        plugin.stop_service()
+        result["init"][scenario] = {
+            "ms": elapsed,
+            "helpers": moviepilot_stubs.MediaServerHelper.instances - helpers_before,
+        }
+    print(json.dumps(result))
+
+
+def run_child(
+    repo_dir: str, relative_dir: str, class_name: str, helper_cost_ms: float, pycache_dir: str
+) -> dict:
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache_dir)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run(
+        [
+            sys.executable,
+            os.path.abspath(__file__),
+            "--child",
+            repo_dir,
+            relative_dir,
+            class_name,
+            str(helper_cost_ms),
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"exit {proc.returncode}"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def export_revision(revision: str, target_dir: str):
+    """
+    从git导出指定版本的插件目录
+    """
+    repo_dir = str(moviepilot_stubs.REPO_DIR)
+    archive = subprocess.run(
+        ["git", "-C", repo_dir, "archive", revision] + [p[0] for p in PLUGINS],
+        capture_output=True,
+        check=True,
+    )
+    subprocess.run(["tar", "-x", "-C", target_dir], input=archive.stdout, check=True)
+
+
+def report(label: str, repo_dir: str, args):
+    for relative_dir, class_name, scenarios in PLUGINS:
+        runs = []
+        pycache_dir = tempfile.mkdtemp(prefix="plugin-startup-pycache-")
+        try:
+            if not args.cold:
+                # 预热一次，生成字节码缓存
+                run_child(repo_dir, relative_dir, class_name, args.helper_cost_ms, pycache_dir)
+            for _ in range(args.repeat):
+                if args.cold:
+                    shutil.rmtree(pycache_dir, ignore_errors=True)
+                runs.append(
+                    run_child(repo_dir, relative_dir, class_name, args.helper_cost_ms, pycache_dir)
+                )
+        finally:
+            shutil.rmtree(pycache_dir, ignore_errors=True)
+        errors = [run["error"] for run in runs if "error" in run]
+        if errors:
+            print(f"{label:<10}{class_name:<20}加载失败: {errors[0]}")
+            continue
+        import_ms = statistics.median(run["import_ms"] for run in runs)
+        modules = statistics.median(run["modules"] for run in runs)
+        crypto_stub = any(run["crypto_stub"] for run in runs)
+        note = "  (Crypto替身)" if crypto_stub else ""
+        print(
+            f"{label:<10}{class_name:<20}{'导入':<16}{import_ms:>10.2f} ms  新增模块 {modules:g}{note}"
+        )
+        for scenario, _ in scenarios:
+            init_ms = statistics.median(run["init"][scenario]["ms"] for run in runs)
+            helpers = max(run["init"][scenario]["helpers"] for run in runs)
+            print(
+                f"{label:<10}{class_name:<20}{'init ' + scenario:<16}{init_ms:>10.2f} ms"
+                f"  MediaServerHelper {helpers}"
+            )
+        if crypto_stub:
+            print(
+                f"警告: 未安装 pycryptodome，{label} {class_name} 导入的是没有开销的Crypto替身，"
+                f"导入耗时不含 pycryptodome，安装后重新运行可得到真实对比",
+                file=sys.stderr,
+            )
+
+
+def main():
+    if len(sys.argv) == 6 and sys.argv[1] == "--child":
+        child(*sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(description="插件加载耗时基准测试")
+    parser.add_argument("--repeat", type=int, default=10, help="每个插件的运行次数")
+    parser.add_argument("--baseline", help="对比的git版本，如 HEAD~1")
+    parser.add_argument(
+        "--helper-cost-ms", type=float, default=30, help="模拟MediaServerHelper创建耗时（毫秒）"
+    )
+    parser.add_argument("--cold", action="store_true", help="不使用字节码缓存")
+    args = parser.parse_args()
+
+    if args.helper_cost_ms:
+        print(
+            f"注意: MediaServerHelper 创建耗时为模拟值 {args.helper_cost_ms:g} ms，"
+            f"init耗时中的这部分差异不代表真实环境的节省，--helper-cost-ms 0 可排除",
+            file=sys.stderr,
+        )
+    report("当前", str(moviepilot_stubs.REPO_DIR), args)
+    if args.baseline:
+        baseline_dir = tempfile.mkdtemp(prefix="plugin-startup-baseline-")
+        try:
+            export_revision(args.baseline, baseline_dir)
+            report(args.baseline, baseline_dir, args)
+        finally:
+            shutil.rmtree(baseline_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+CloudTransferStrm strm写入模式基准测试
+
+对比 direct / atomic / durable 三种写入模式在tmpfs与普通磁盘上的吞吐，
+模拟按季目录批量写入剧集strm文件的场景。
+普通磁盘默认使用仓库目录（临时目录可能是tmpfs），输出中会列出各目录实际所在的文件系统类型。
+
+用法: python benchmarks/strm_write_bench.py [--files 2000] [--per-dir 20] [--tmpfs /dev/shm] [--disk 仓库目录]
+"""
+import argparse
+import importlib.util
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+PLUGIN_DIR = REPO_DIR / "plugins.v2" / "cloudtransferstrm"
+
+
+def load_strm_writer():
+    """
+    直接按文件加载strmwriter，无需MoviePilot环境
+    """
+    spec = importlib.util.spec_from_file_location(
+        "cloudtransferstrm_strmwriter", PLUGIN_DIR / "strmwriter.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.StrmWriter
+
+
+def fs_type(path: str) -> str:
+    """
+    从 /proc/mounts 查找目录所在的文件系统类型，非Linux系统返回unknown
+    """
+    path = os.path.realpath(path)
+    matched, matched_type = "", "unknown"
+    try:
+        with open("/proc/mounts", "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                mount_point = parts[1].replace("\\040", " ")
+                if (
+                    path == mount_point
+                    or path.startswith(mount_point.rstrip("/") + "/")
+                ) and len(mount_point) >= len(matched):
+                    matched, matched_type = mount_point, parts[2]
+    except OSError:
+        pass
+    return matched_type
+
+
+def run_mode(StrmWriter, mode: str, base_dir: str, files: int, per_dir: int) -> dict:
+    work_dir = tempfile.mkdtemp(prefix=f"strm-bench-{mode}-", dir=base_dir)
+    try:
+        start = time.perf_counter()
+        with StrmWriter(mode=mode) as writer:
+            for i in range(files):
+                strm_file = os.path.join(
+                    work_dir, f"show{i // per_dir:04d}", "Season 01", f"S01E{i % per_dir:02d}.strm"
+                )
+                writer.write(strm_file, f"https://alist.example/d/media/show/{i}.mkv")
+        elapsed = time.perf_counter() - start
+        return {"elapsed": elapsed, "rate": files / elapsed if elapsed else 0, **writer.stats}
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="strm写入模式基准测试")
+    parser.add_argument("--files", type=int, default=2000, help="写入的strm文件数")
+    parser.add_argument("--per-dir", type=int, default=20, help="每个目录的文件数")
+    parser.add_argument("--tmpfs", default="/dev/shm", help="tmpfs目录")
+    parser.add_argument("--disk", default=str(REPO_DIR), help="普通磁盘目录，默认为仓库目录")
+    args = parser.parse_args()
+
+    StrmWriter = load_strm_writer()
+    targets = [("tmpfs", args.tmpfs), ("disk", args.disk)]
+    for target_name, base_dir in targets:
+        if os.path.isdir(base_dir):
+            print(f"{target_name}: {base_dir} ({fs_type(base_dir)})")
+    print(f"{'target':<8}{'mode':<10}{'files/s':>12}{'elapsed(s)':>12}{'fsync':>8}{'dir_fsync':>11}")
+    for target_name, base_dir in targets:
+        if not os.path.isdir(base_dir):
+            print(f"{target_name:<8}跳过，目录不存在: {base_dir}")
+            continue
+        for mode in StrmWriter.MODES:
+            result = run_mode(StrmWriter, mode, base_dir, args.files, args.per_dir)
+            print(
+                f"{target_name:<8}{mode:<10}{result['rate']:>12.0f}{result['elapsed']:>12.3f}"
+                f"{result['fsync']:>8}{result['dir_fsync']:>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 import traceback
 import time
 from pathlib import Path
@@ -10,7 +11,13 @@ from app.core.event import eventmanager, Event
 from app.log import logger
 from app.plugins import _PluginBase
 from app.schemas.types import EventType
-from app.helper.mediaserver import MediaServerHelper
+
+from .jobscheduler import JobScheduler
+from .strmwriter import StrmWriter
+
+lock = threading.Lock()
+# 保护实时任务共用的strm写入器和待刷新列表
+strm_lock = threading.Lock()
 
 
 class CloudTransferStrm(_PluginBase):
@@ -21,7 +28,7 @@ class CloudTransferStrm(_PluginBase):
     # 插件图标
     plugin_icon = "https://raw.githubusercontent.com/thsrite/MoviePilot-Plugins/main/icons/cloudcompanion.png"
     # 插件版本
-    plugin_version = "1.0.1"
+    plugin_version = "1.1.0"
     # 插件作者
     plugin_author = "ahjsrhj"
     # 作者主页
@@ -38,23 +45,52 @@ class CloudTransferStrm(_PluginBase):
     _enabled = False
     _monitor_confs = None
     _refresh_emby = False
+    # strm写入模式: direct/atomic/durable
+    _write_mode = StrmWriter.MODE_ATOMIC
+    # 后台批量任务每秒最大操作数（云盘挂载及Emby），0为不限速
+    _bulk_ops_limit = 5
+    # 后台任务中durable模式每暂存多少个文件提交一次
+    _bulk_commit_batch = 20
     # 配置字典: key为local_dir, value为包含strm_dir和alist_host的字典
     _monitor_configs = {}
 
-    mediaserver_helper = None
+    # 媒体服务器帮助类，首次通知Emby时才创建
+    _mediaserver_helper = None
+    # 实时/后台两级任务调度器
+    _job_scheduler = None
+    # 实时任务共用的strm写入器，durable模式下多个剧集合并提交
+    _live_writer = None
+    # 已写入、等待提交后通知Emby刷新的strm文件
+    _pending_refresh = None
+    # durable模式下实时队列清空后等待合并提交的秒数
+    _live_commit_delay = 1
+    # 实时写入器暂存超过该数量时立即提交
+    _live_commit_batch = 50
+    # 是否还需清理上次异常退出遗留的临时文件，随第一个任务一起提交
+    _sweep_pending = False
 
     def init_plugin(self, config: dict = None):
         """
         初始化插件
         """
-        # 清空配置
-        self._monitor_configs = {}
-        self.mediaserver_helper = MediaServerHelper()
-
         # 初始化配置，确保_monitor_confs始终是字符串
         if config:
             self._enabled = config.get("enabled", False)
             self._refresh_emby = config.get("refresh_emby")
+            self._write_mode = config.get("write_mode") or StrmWriter.MODE_ATOMIC
+            if self._write_mode not in StrmWriter.MODES:
+                logger.warning(f"未知的strm写入模式 {self._write_mode}，使用原子写入")
+                self._write_mode = StrmWriter.MODE_ATOMIC
+            # 未配置时使用默认限速，只有明确配置为0才不限速
+            bulk_ops_limit = config.get("bulk_ops_limit")
+            if bulk_ops_limit is None or str(bulk_ops_limit).strip() == "":
+                self._bulk_ops_limit = CloudTransferStrm._bulk_ops_limit
+            else:
+                try:
+                    self._bulk_ops_limit = max(0.0, float(bulk_ops_limit))
+                except (TypeError, ValueError):
+                    logger.warning(f"后台任务限速配置错误: {bulk_ops_limit}，使用默认值")
+                    self._bulk_ops_limit = CloudTransferStrm._bulk_ops_limit
             monitor_confs_value = config.get("monitor_confs")
             # 确保是字符串类型
             self._monitor_confs = (
@@ -65,10 +101,32 @@ class CloudTransferStrm(_PluginBase):
             self._enabled = False
             self._monitor_confs = ""
 
-        # 如果未启用，直接返回
+        # 如果未启用，清空配置、停止调度后直接返回
         if not self._enabled:
+            self._monitor_configs = {}
+            self.__stop_job_scheduler()
             return
 
+        # 写入模式变化时先提交旧写入器暂存的文件，下次写入时按新模式创建
+        if self._live_writer and self._live_writer.mode != self._write_mode:
+            self.__flush_live_writer(reset=True)
+
+        # 调度器在重新加载配置时保留，避免丢弃排队中的任务；工作线程在提交第一个任务时才启动
+        if not self._job_scheduler:
+            self._job_scheduler = JobScheduler(
+                on_error=lambda name, err: logger.error(f"任务 {name} 执行失败: {str(err)}"),
+                name="CloudTransferStrm-scheduler",
+                on_live_idle=self.__flush_live_writer,
+            )
+            # 恢复暂停状态
+            if self.get_data("bulk_paused"):
+                self._job_scheduler.pause()
+            self._sweep_pending = self._write_mode != StrmWriter.MODE_DIRECT
+        self._job_scheduler.bulk_ops_per_second = self._bulk_ops_limit
+        self._job_scheduler.live_idle_delay = (
+            self._live_commit_delay if self._write_mode == StrmWriter.MODE_DURABLE else 0
+        )
+
         # 双重保险：确保_monitor_confs是字符串类型且不为None
         if self._monitor_confs is None:
             self._monitor_confs = ""
@@ -78,23 +136,53 @@ class CloudTransferStrm(_PluginBase):
         # 如果没有配置内容，直接返回
         if not self._monitor_confs:
             logger.warning("插件已启用但未配置监控目录，请配置 monitor_confs")
+            self._monitor_configs = {}
             return
 
-        # 解析目录配置
-        # 格式: local_dir#strm_dir#alist_host
-        # 此时_monitor_confs已经确保是字符串类型
-        try:
-            monitor_conf_lines = self._monitor_confs.split("\n")
-        except AttributeError:
-            logger.error(
-                f"monitor_confs类型错误: {type(self._monitor_confs)}, 值: {self._monitor_confs}"
-            )
-            # 强制转换为字符串
-            self._monitor_confs = (
-                str(self._monitor_confs) if self._monitor_confs is not None else ""
+        new_configs = self.__parse_monitor_confs(self._monitor_confs)
+        self.__apply_monitor_configs(new_configs)
+
+        # 已生效配置记录strm文件当前对应的配置，映射重新同步完成后才更新，
+        # 同步中断、停用或重启丢弃了排队的任务后，再次初始化时仍能发现差异并重新排队
+        resync_dirs = []
+        with lock:
+            applied_configs = self.get_data("monitor_configs") or {}
+            new_applied = {}
+            for local_dir, conf in new_configs.items():
+                applied_conf = applied_configs.get(local_dir)
+                if applied_conf and self.__need_resync(applied_conf, conf):
+                    new_applied[local_dir] = applied_conf
+                    resync_dirs.append(local_dir)
+                else:
+                    new_applied[local_dir] = conf
+            self.save_data("monitor_configs", new_applied)
+
+        for local_dir in resync_dirs:
+            self._job_scheduler.submit_bulk(
+                f"重新同步 {local_dir}", self.__resync_mapping(local_dir)
             )
-            monitor_conf_lines = self._monitor_confs.split("\n")
-        for monitor_conf in monitor_conf_lines:
+        if resync_dirs:
+            self.__submit_sweep()
+
+    def __submit_sweep(self):
+        """
+        提交清理遗留临时文件的后台任务，每次启动只提交一次，
+        推迟到第一个任务提交时，避免插件加载时就启动工作线程
+        """
+        if not self._sweep_pending or not self._job_scheduler:
+            return
+        self._sweep_pending = False
+        self._job_scheduler.submit_bulk("清理临时文件", self.__sweep_temp_files())
+
+    def __parse_monitor_confs(self, monitor_confs: str) -> Dict[str, dict]:
+        """
+        解析目录配置
+        格式: local_dir#strm_dir#alist_host
+        :param monitor_confs: 目录配置文本
+        :return: key为local_dir, value为包含strm_dir和alist_host的字典
+        """
+        configs = {}
+        for monitor_conf in monitor_confs.split("\n"):
             # 跳过空行
             if not monitor_conf or not monitor_conf.strip():
                 continue
@@ -122,15 +210,207 @@ class CloudTransferStrm(_PluginBase):
             if local_dir != "/" and local_dir.endswith("/"):
                 local_dir = local_dir.rstrip("/")
 
-            # 存储配置
-            self._monitor_configs[local_dir] = {
+            configs[local_dir] = {
                 "strm_dir": strm_dir,
                 "alist_host": alist_host,
             }
+        return configs
+
+    def __apply_monitor_configs(self, new_configs: Dict[str, dict]):
+        """
+        对比新旧配置，只记录有变化的映射，最后整体替换配置字典，
+        避免其它线程遍历配置时字典被修改
+        :param new_configs: 新解析出的配置
+        """
+        old_configs = self._monitor_configs
+        for local_dir in old_configs.keys():
+            if local_dir not in new_configs:
+                logger.info(f"移除监控配置: local_dir={local_dir}")
+        for local_dir, conf in new_configs.items():
+            if old_configs.get(local_dir) == conf:
+                continue
+            logger.info(
+                f"加载监控配置: local_dir={local_dir}, strm_dir={conf['strm_dir']}, alist_host={conf['alist_host']}"
+            )
+        self._monitor_configs = new_configs
+
+    @staticmethod
+    def __match_local_dir(target_path: str, local_dirs) -> str:
+        """
+        查找路径所属的映射，存在嵌套映射时取最长的local_dir
+        :param target_path: 云盘文件路径
+        :param local_dirs: 已配置的local_dir
+        :return: 匹配的local_dir，未匹配时返回None
+        """
+        matched_local_dir = None
+        for local_dir in local_dirs:
+            # 需要确保匹配的是完整路径段，而不是部分匹配
+            if target_path == local_dir or target_path.startswith(
+                local_dir.rstrip("/") + "/"
+            ):
+                if not matched_local_dir or len(local_dir) > len(matched_local_dir):
+                    matched_local_dir = local_dir
+        return matched_local_dir
+
+    @staticmethod
+    def __need_resync(old_conf: dict, new_conf: dict) -> bool:
+        """
+        strm_dir或alist_host变化的映射需要重新同步
+        """
+        return (
+            old_conf.get("strm_dir") != new_conf.get("strm_dir")
+            or old_conf.get("alist_host") != new_conf.get("alist_host")
+        )
+
+    def __resync_mapping(self, local_dir: str):
+        """
+        后台任务：将映射的strm文件从已生效配置同步到当前配置，完成后才更新已生效配置
+        执行时才读取配置，排队期间配置再次修改也会同步到最新配置
+        """
+        while True:
+            applied_conf = (self.get_data("monitor_configs") or {}).get(local_dir)
+            current_conf = self._monitor_configs.get(local_dir)
+            if (
+                not applied_conf
+                or not current_conf
+                or not self.__need_resync(applied_conf, current_conf)
+            ):
+                return
+            synced = yield from self.__rewrite_strm_tree(
+                local_dir, applied_conf, current_conf
+            )
+            if not synced:
+                logger.warning(f"映射 {local_dir} 重新同步未完成，下次加载配置时重试")
+                return
+            with lock:
+                applied_configs = self.get_data("monitor_configs") or {}
+                if local_dir in applied_configs:
+                    applied_configs[local_dir] = current_conf
+                    self.save_data("monitor_configs", applied_configs)
+
+    def __sweep_temp_files(self):
+        """
+        后台任务：清理各strm目录中遗留的临时文件，每列出一个目录yield一次
+        """
+        recovered = 0
+        removed = 0
+        strm_dirs = {conf["strm_dir"] for conf in self._monitor_configs.values()}
+        for strm_dir in strm_dirs:
+            for root, _, files in os.walk(strm_dir):
+                dir_recovered, dir_removed = StrmWriter.sweep_temp_files(root, files)
+                recovered += dir_recovered
+                removed += dir_removed
+                yield
+        if recovered or removed:
             logger.info(
-                f"加载监控配置: local_dir={local_dir}, strm_dir={strm_dir}, alist_host={alist_host}"
+                f"处理遗留的strm临时文件：恢复未提交的文件 {recovered} 个，删除 {removed} 个"
             )
 
+    def __rewrite_strm_tree(self, local_dir: str, old_conf: dict, new_conf: dict):
+        """
+        流式遍历旧strm目录，按新配置改写strm文件，无需全量重新生成
+        strm_dir变化时写入新目录（旧目录保留），alist_host变化时替换文件内容前缀
+        作为后台任务执行，每次读写云盘或通知Emby后yield一次，由调度器限速
+        :return: 是否同步成功
+        """
+        old_strm_dir = old_conf["strm_dir"]
+        new_strm_dir = new_conf["strm_dir"]
+        old_prefix = old_conf["alist_host"]
+        new_prefix = new_conf["alist_host"]
+        if not os.path.isdir(old_strm_dir):
+            logger.warning(f"strm目录不存在，跳过重新同步: {old_strm_dir}")
+            return True
+
+        logger.info(
+            f"开始重新同步映射 {local_dir}: {old_strm_dir} -> {new_strm_dir}, {old_prefix} -> {new_prefix}"
+        )
+        rewritten = 0
+        failed = 0
+        refresh_files = []
+        # 嵌套映射时子映射的strm目录可能位于本映射的strm目录下，不属于本映射
+        monitor_configs = self._monitor_configs
+        other_strm_dirs = {
+            os.path.normpath(conf["strm_dir"])
+            for other_dir, conf in monitor_configs.items()
+            if other_dir != local_dir
+        }
+        writer = StrmWriter(mode=self._write_mode, batch_size=0)
+        for root, dirs, files in os.walk(old_strm_dir):
+            dirs[:] = [
+                d
+                for d in dirs
+                if os.path.normpath(os.path.join(root, d)) not in other_strm_dirs
+            ]
+            # 列出目录也是一次云盘操作
+            StrmWriter.sweep_temp_files(root, files)
+            yield
+            for name in files:
+                if not name.endswith(".strm"):
+                    continue
+                old_file = os.path.join(root, name)
+                try:
+                    with open(old_file, "r", encoding="utf-8") as f:
+                        content = f.read().strip()
+                except Exception as e:
+                    logger.error(f"读取strm文件失败 {old_file} -> {str(e)}")
+                    failed += 1
+                    continue
+                yield
+                # 只处理由当前映射生成的strm文件，文件路径属于更长的嵌套映射时跳过
+                if not content.startswith(old_prefix):
+                    continue
+                target_path = content[len(old_prefix):]
+                if (
+                    self.__match_local_dir(target_path, monitor_configs.keys())
+                    != local_dir
+                ):
+                    continue
+                new_content = new_prefix + content[len(old_prefix):]
+                new_file = os.path.join(
+                    new_strm_dir, os.path.relpath(old_file, old_strm_dir)
+                )
+                if new_file == old_file and new_content == content:
+                    continue
+                if self.__create_strm_file(
+                    strm_file=new_file, strm_content=new_content, writer=writer
+                ):
+                    rewritten += 1
+                    if self._refresh_emby and new_file != old_file:
+                        refresh_files.append(new_file)
+                else:
+                    failed += 1
+                yield
+                # durable模式小批量提交，每fsync一个目录计一次操作
+                if writer.pending >= self._bulk_commit_batch:
+                    synced_dirs = yield from self.__commit_bulk_writer(writer)
+                    if synced_dirs is None:
+                        return False
+        synced_dirs = yield from self.__commit_bulk_writer(writer)
+        if synced_dirs is None:
+            return False
+        for refresh_file in refresh_files:
+            self.__refresh_emby_file(refresh_file)
+            yield
+        logger.info(
+            f"映射 {local_dir} 重新同步完成，共改写 {rewritten} 个strm文件，失败 {failed} 个"
+        )
+        return failed == 0
+
+    @staticmethod
+    def __commit_bulk_writer(writer: StrmWriter):
+        """
+        提交后台任务写入器暂存的文件，每fsync一个目录yield一次
+        :return: fsync的目录数，失败时返回None
+        """
+        try:
+            synced_dirs = writer.commit()
+        except Exception as e:
+            logger.error(f"提交strm文件失败: {str(e)}")
+            return None
+        for _ in range(synced_dirs):
+            yield
+        return synced_dirs
+
     @eventmanager.register(EventType.TransferComplete)
     def transfer_complete(self, event: Event = None):
         """
@@ -171,22 +451,37 @@ class CloudTransferStrm(_PluginBase):
                 logger.debug(f"{target_path} 不是媒体文件，跳过处理")
                 return
 
-            # 查找匹配的监控配置
-            matched_local_dir = None
-            for local_dir in self._monitor_configs.keys():
-                # 检查target_path是否以local_dir开头
-                # 需要确保匹配的是完整路径段，而不是部分匹配
-                if target_path == local_dir or target_path.startswith(local_dir + "/"):
-                    # 选择最长的匹配路径（避免子路径匹配到父路径）
-                    if not matched_local_dir or len(local_dir) > len(matched_local_dir):
-                        matched_local_dir = local_dir
+            # 作为实时任务提交，优先于后台批量任务执行
+            if not self._job_scheduler:
+                logger.warning("任务调度器未启动，跳过处理")
+                return
+            self.__submit_sweep()
+            self._job_scheduler.submit_live(
+                f"生成strm {target_path}", self.__generate_strm, target_path
+            )
+            return True
 
+        except Exception as e:
+            logger.error(f"处理入库成功通知失败: {str(e)} - {traceback.format_exc()}")
+
+    def __generate_strm(self, target_path: str):
+        """
+        根据入库文件路径生成strm文件并通知Emby刷新
+        :param target_path: 入库后的媒体文件路径
+        """
+        try:
+            # 取配置字典的引用，重新加载配置时整体替换，不影响本次遍历
+            monitor_configs = self._monitor_configs
+            # 查找匹配的监控配置
+            matched_local_dir = self.__match_local_dir(
+                target_path, monitor_configs.keys()
+            )
             if not matched_local_dir:
                 logger.debug(f"未找到匹配的监控配置: {target_path}")
                 return
 
             # 获取配置
-            config = self._monitor_configs[matched_local_dir]
+            config = monitor_configs[matched_local_dir]
             strm_dir = config["strm_dir"]
             alist_host = config["alist_host"]
 
@@ -208,49 +503,89 @@ class CloudTransferStrm(_PluginBase):
             # 生成strm文件内容: alist_host + target_path
             strm_content = alist_host + target_path
 
-            # 创建strm文件
-            self.__create_strm_file(strm_file=strm_file_path, strm_content=strm_content)
-
-            logger.info(f"成功生成strm文件: {strm_file_path} -> {strm_content}")
-
-            # 通知emby刷新
-            if self._refresh_emby:
-                time.sleep(0.1)
-                self.__refresh_emby_file(strm_file_path)
+            # 创建strm文件，使用共用写入器，实时队列清空后合并提交并通知emby刷新
+            with strm_lock:
+                if not self._live_writer:
+                    self._live_writer = StrmWriter(mode=self._write_mode, batch_size=0)
+                if not self.__create_strm_file(
+                    strm_file=strm_file_path,
+                    strm_content=strm_content,
+                    writer=self._live_writer,
+                ):
+                    return False
+                if self._refresh_emby:
+                    if self._pending_refresh is None:
+                        self._pending_refresh = []
+                    self._pending_refresh.append(strm_file_path)
+                flush = self._live_writer.pending >= self._live_commit_batch
+
+            if flush:
+                self.__flush_live_writer()
             return True
-
-
         except Exception as e:
-            logger.error(f"处理入库成功通知失败: {str(e)} - {traceback.format_exc()}")
+            logger.error(f"生成strm文件失败: {str(e)} - {traceback.format_exc()}")
 
-    def __create_strm_file(self, strm_file: str, strm_content: str):
+    def __flush_live_writer(self, reset: bool = False):
         """
-        生成strm文件
+        提交实时写入器暂存的strm文件，并通知emby刷新
+        :param reset: 提交后是否丢弃写入器
+        """
+        with strm_lock:
+            refresh_files, self._pending_refresh = self._pending_refresh, None
+            writer = self._live_writer
+            if reset:
+                self._live_writer = None
+            if writer:
+                staged = writer.pending
+                try:
+                    writer.commit()
+                except Exception as e:
+                    logger.error(f"提交strm文件失败: {str(e)}")
+                    # 保留待刷新列表，下次提交成功后一并通知
+                    self._pending_refresh = refresh_files
+                    return
+                if staged:
+                    logger.info(f"提交strm文件成功，共 {staged} 个")
+        if not refresh_files:
+            return
+        time.sleep(0.1)
+        for refresh_file in refresh_files:
+            self.__refresh_emby_file(refresh_file)
+
+    @staticmethod
+    def __create_strm_file(strm_file: str, strm_content: str, writer: StrmWriter):
+        """
+        生成strm文件，目标文件夹由写入器创建
         :param strm_file: strm文件路径
         :param strm_content: strm文件内容
+        :param writer: 共用的写入器，durable模式下由调用方负责提交
         """
         try:
-            # 确保目录存在
-            strm_file_path = Path(strm_file)
-            if not strm_file_path.parent.exists():
-                logger.info(f"创建目标文件夹 {strm_file_path.parent}")
-                os.makedirs(strm_file_path.parent, exist_ok=True)
-
-            # 写入.strm文件
-            with open(strm_file, "w", encoding="utf-8") as f:
-                f.write(strm_content)
-
-            logger.info(f"创建strm文件成功: {strm_file} -> {strm_content}")
+            writer.write(strm_file, strm_content)
+            if writer.mode == StrmWriter.MODE_DURABLE:
+                logger.info(f"暂存strm文件，等待提交: {strm_file} -> {strm_content}")
+            else:
+                logger.info(f"创建strm文件成功: {strm_file} -> {strm_content}")
             return True
         except Exception as e:
             logger.error(f"创建strm文件失败 {strm_file} -> {str(e)}")
             return False
 
+    def __get_mediaserver_helper(self):
+        """
+        延迟创建媒体服务器帮助类，插件未启用或未开启Emby刷新时不产生开销
+        """
+        if not self._mediaserver_helper:
+            from app.helper.mediaserver import MediaServerHelper
+
+            self._mediaserver_helper = MediaServerHelper()
+        return self._mediaserver_helper
+
     def __refresh_emby_file(self, strm_file: str):
         """
         通知emby刷新文件
         """
-        emby_servers = self.mediaserver_helper.get_services(type_filter="emby")
+        emby_servers = self.__get_mediaserver_helper().get_services(type_filter="emby")
         if not emby_servers:
             logger.error("未配置Emby媒体服务器")
             return
@@ -297,10 +632,75 @@ class CloudTransferStrm(_PluginBase):
         # 清空配置
         self._monitor_configs = {}
         self._enabled = False
+        self.__stop_job_scheduler()
         logger.info("插件服务已停止")
 
+    def __stop_job_scheduler(self):
+        """
+        停止任务调度器，丢弃未执行的任务
+        """
+        if self._job_scheduler:
+            self._job_scheduler.stop(timeout=5)
+            self._job_scheduler = None
+        self.__flush_live_writer()
+
+    def pause_bulk(self):
+        """
+        API: 暂停后台批量任务
+        """
+        if not self._job_scheduler:
+            return {"success": False, "message": "插件未启用"}
+        self._job_scheduler.pause()
+        self.save_data("bulk_paused", True)
+        logger.info("后台批量任务已暂停")
+        return {"success": True, "message": "后台任务已暂停"}
+
+    def resume_bulk(self):
+        """
+        API: 恢复后台批量任务
+        """
+        if not self._job_scheduler:
+            return {"success": False, "message": "插件未启用"}
+        self._job_scheduler.resume()
+        self.save_data("bulk_paused", False)
+        logger.info("后台批量任务已恢复")
+        return {"success": True, "message": "后台任务已恢复"}
+
+    def bulk_status(self):
+        """
+        API: 查询任务调度状态
+        """
+        if not self._job_scheduler:
+            return {"success": False, "message": "插件未启用"}
+        return {"success": True, "data": self._job_scheduler.status()}
+
     def get_api(self) -> List[Dict[str, Any]]:
-        pass
+        return [
+            {
+                "path": "/bulk/pause",
+                "endpoint": self.pause_bulk,
+                "methods": ["GET"],
+                "auth": "bear",
+                "summary": "暂停后台任务",
+                "description": "暂停重新同步等后台批量任务，实时生成strm不受影响",
+            },
+            {
+                "path": "/bulk/resume",
+                "endpoint": self.resume_bulk,
+                "methods": ["GET"],
+                "auth": "bear",
+                "summary": "恢复后台任务",
+                "description": "恢复已暂停的后台批量任务",
+            },
+            {
+                "path": "/bulk/status",
+                "endpoint": self.bulk_status,
+                "methods": ["GET"],
+                "auth": "bear",
+                "summary": "任务调度状态",
+                "description": "查询实时任务与后台任务的排队情况",
+            },
+        ]
 
     def get_form(self) -> Tuple[List[dict], Dict[str, Any]]:
         """
@@ -339,6 +739,40 @@ class CloudTransferStrm(_PluginBase):
                                     }
                                 ],
                             },
+                            {
+                                "component": "VCol",
+                                "props": {"cols": 12, "md": 4},
+                                "content": [
+                                    {
+                                        "component": "VTextField",
+                                        "props": {
+                                            "model": "bulk_ops_limit",
+                                            "label": "后台任务限速（次/秒）",
+                                            "type": "number",
+                                            "hint": "重新同步等后台任务每秒访问云盘和Emby的最大次数，0为不限速",
+                                            "persistent-hint": True,
+                                        },
+                                    }
+                                ],
+                            },
+                            {
+                                "component": "VCol",
+                                "props": {"cols": 12, "md": 4},
+                                "content": [
+                                    {
+                                        "component": "VSelect",
+                                        "props": {
+                                            "model": "write_mode",
+                                            "label": "strm写入模式",
+                                            "items": [
+                                                {"title": "直接写入", "value": StrmWriter.MODE_DIRECT},
+                                                {"title": "原子写入", "value": StrmWriter.MODE_ATOMIC},
+                                                {"title": "原子写入并落盘", "value": StrmWriter.MODE_DURABLE},
+                                            ],
+                                        },
+                                    }
+                                ],
+                            },
                         ],
                     },
                     {
@@ -367,7 +801,99 @@ class CloudTransferStrm(_PluginBase):
             "enabled": False,
             "monitor_confs": "",
             "refresh_emby": False,
+            "write_mode": StrmWriter.MODE_ATOMIC,
+            "bulk_ops_limit": 5,
         }
 
     def get_page(self) -> List[dict]:
-        pass
+        """
+        拼装插件详情页面，展示任务调度状态并提供暂停/恢复后台任务的按钮
+        """
+        if not self._job_scheduler:
+            return [
+                {
+                    "component": "div",
+                    "text": "插件未启用",
+                    "props": {"class": "text-center"},
+                }
+            ]
+        status = self._job_scheduler.status()
+        limit = status["bulk_ops_per_second"]
+        items = [
+            ("后台任务状态", "已暂停" if status["paused"] else "运行中"),
+            ("当前后台任务", status["bulk_current"] or "无"),
+            ("排队中的后台任务", status["bulk_pending"]),
+            ("排队中的实时任务", status["live_pending"]),
+            ("已完成实时任务", status["live_done"]),
+            ("已完成后台操作", status["bulk_ops"]),
+            ("后台任务限速", f"{limit:g} 次/秒" if limit else "不限速"),
+        ]
+        return [
+            {
+                "component": "VRow",
+                "content": [
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12},
+                        "content": [
+                            {
+                                "component": "VTable",
+                                "props": {"hover": True},
+                                "content": [
+                                    {
+                                        "component": "tbody",
+                                        "content": [
+                                            {
+                                                "component": "tr",
+                                                "content": [
+                                                    {"component": "td", "text": title},
+                                                    {"component": "td", "text": str(value)},
+                                                ],
+                                            }
+                                            for title, value in items
+                                        ],
+                                    }
+                                ],
+                            }
+                        ],
+                    },
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "class": "d-flex justify-end"},
+                        "content": [
+                            {
+                                "component": "VBtn",
+                                "props": {
+                                    "color": "warning",
+                                    "variant": "tonal",
+                                    "class": "mr-2",
+                                    "disabled": status["paused"],
+                                },
+                                "text": "暂停后台任务",
+                                "events": {
+                                    "click": {
+                                        "api": "plugin/CloudTransferStrm/bulk/pause",
+                                        "method": "get",
+                                    }
+                                },
+                            },
+                            {
+                                "component": "VBtn",
+                                "props": {
+                                    "color": "primary",
+                                    "variant": "tonal",
+                                    "disabled": not status["paused"],
+                                },
+                                "text": "恢复后台任务",
+                                "events": {
+                                    "click": {
+                                        "api": "plugin/CloudTransferStrm/bulk/resume",
+                                        "method": "get",
+                                    }
+                                },
+                            },
+                        ],
+                    },
+                ],
+            }
+        ]
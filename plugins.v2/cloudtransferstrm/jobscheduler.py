@@ -0,0 +1,221 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class JobScheduler:
+    """
+    两级任务调度器
+    live: 实时任务（入库生成strm），总是优先执行
+    bulk: 后台批量任务（重新同步、改写等），以生成器形式提交，每次yield视为一次操作，
+          按每秒操作数限速，可暂停/恢复，并在每次操作之间让出给实时任务
+    所有任务在同一个工作线程中串行执行，工作线程在提交第一个任务时才启动
+    实时队列清空后，等待live_idle_delay秒调用一次on_live_idle，用于合并提交实时任务的写入
+    """
+
+    def __init__(
+        self,
+        bulk_ops_per_second: float = 0,
+        on_error: Optional[Callable[[str, Exception], Any]] = None,
+        name: str = "JobScheduler",
+        on_live_idle: Optional[Callable[[], Any]] = None,
+        live_idle_delay: float = 0,
+    ):
+        """
+        :param bulk_ops_per_second: 后台任务每秒最大操作数，0表示不限速
+        :param on_error: 任务异常回调，参数为任务名称和异常
+        :param name: 工作线程名称
+        :param on_live_idle: 实时队列清空后的回调
+        :param live_idle_delay: 实时队列清空后延迟多少秒调用on_live_idle，期间到达的实时任务合并处理
+        """
+        self._live = deque()
+        self._bulk = deque()
+        self._cond = threading.Condition()
+        self._paused = False
+        self._stopped = False
+        self._next_bulk_at = 0.0
+        # 已开始执行的后台任务
+        self._bulk_started = None
+        # 下次调用on_live_idle的时间，None表示没有待处理的实时任务写入
+        self._idle_due = None
+        self._on_live_idle = on_live_idle
+        self.live_idle_delay = live_idle_delay
+        self._on_error = on_error
+        self._name = name
+        self._thread = None
+        self.bulk_ops_per_second = bulk_ops_per_second
+        # 统计信息
+        self.stats: Dict[str, int] = {"live_done": 0, "bulk_ops": 0, "bulk_done": 0}
+
+    @property
+    def bulk_ops_per_second(self) -> float:
+        return self._bulk_ops_per_second
+
+    @bulk_ops_per_second.setter
+    def bulk_ops_per_second(self, value: float):
+        with self._cond:
+            self._bulk_ops_per_second = max(0.0, float(value or 0))
+            self._cond.notify_all()
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    def start(self):
+        """
+        启动工作线程
+        """
+        with self._cond:
+            self._stopped = False
+            self.__start_locked()
+
+    def __start_locked(self):
+        """
+        工作线程未运行时启动，调用方需持有锁
+        """
+        if self._stopped or (self._thread and self._thread.is_alive()):
+            return
+        self._thread = threading.Thread(target=self.__run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """
+        停止工作线程，未执行的任务将被丢弃，需要恢复的后台任务由调用方重新提交
+        """
+        with self._cond:
+            self._stopped = True
+            self._live.clear()
+            self._bulk.clear()
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def submit_live(self, name: str, func: Callable, *args, **kwargs):
+        """
+        提交实时任务
+        """
+        with self._cond:
+            self._live.append((name, func, args, kwargs))
+            self.__start_locked()
+            self._cond.notify_all()
+
+    def submit_bulk(self, name: str, job: Iterator) -> bool:
+        """
+        提交后台批量任务，已有同名任务排队且未开始执行时忽略
+        :param job: 生成器，每次yield表示完成一次对云盘或媒体服务器的操作
+        :return: 是否已加入队列
+        """
+        with self._cond:
+            for queued in self._bulk:
+                if queued[0] == name and queued is not self._bulk_started:
+                    job.close()
+                    return False
+            self._bulk.append((name, job))
+            self.__start_locked()
+            self._cond.notify_all()
+            return True
+
+    def pause(self):
+        """
+        暂停后台任务，实时任务不受影响
+        """
+        with self._cond:
+            self._paused = True
+
+    def resume(self):
+        """
+        恢复后台任务
+        """
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+
+    def status(self) -> Dict[str, Any]:
+        """
+        当前调度状态
+        """
+        with self._cond:
+            return {
+                "paused": self._paused,
+                "live_pending": len(self._live),
+                "bulk_pending": len(self._bulk),
+                "bulk_current": self._bulk[0][0] if self._bulk else None,
+                "bulk_ops_per_second": self._bulk_ops_per_second,
+                **self.stats,
+            }
+
+    def __next_job(self):
+        """
+        取下一个要执行的任务，实时任务优先；没有可执行任务时阻塞等待
+        """
+        with self._cond:
+            while not self._stopped:
+                if self._live:
+                    return "live", self._live.popleft()
+                now = time.monotonic()
+                timeout = None
+                if self._idle_due is not None:
+                    if now >= self._idle_due:
+                        self._idle_due = None
+                        return "idle", None
+                    timeout = self._idle_due - now
+                if self._bulk and not self._paused:
+                    delay = self._next_bulk_at - now
+                    if delay <= 0:
+                        self._bulk_started = self._bulk[0]
+                        return "bulk", self._bulk[0]
+                    timeout = delay if timeout is None else min(timeout, delay)
+                # 等待期间，新的实时任务会唤醒线程
+                self._cond.wait(timeout)
+            return None, None
+
+    def __run(self):
+        while True:
+            kind, job = self.__next_job()
+            if kind is None:
+                return
+            if kind == "live":
+                name, func, args, kwargs = job
+                try:
+                    func(*args, **kwargs)
+                except Exception as e:
+                    self.__handle_error(name, e)
+                self.stats["live_done"] += 1
+                if self._on_live_idle:
+                    with self._cond:
+                        if self._idle_due is None:
+                            self._idle_due = time.monotonic() + self.live_idle_delay
+                continue
+            if kind == "idle":
+                try:
+                    self._on_live_idle()
+                except Exception as e:
+                    self.__handle_error("on_live_idle", e)
+                continue
+
+            name, gen = job
+            finished = False
+            try:
+                next(gen)
+                self.stats["bulk_ops"] += 1
+            except StopIteration:
+                finished = True
+            except Exception as e:
+                self.__handle_error(name, e)
+                finished = True
+            with self._cond:
+                if finished:
+                    if self._bulk and self._bulk[0] is job:
+                        self._bulk.popleft()
+                    self.stats["bulk_done"] += 1
+                elif self._bulk_ops_per_second > 0:
+                    self._next_bulk_at = time.monotonic() + 1 / self._bulk_ops_per_second
+
+    def __handle_error(self, name: str, err: Exception):
+        if self._on_error:
+            try:
+                self._on_error(name, err)
+            except Exception:
+                pass
@@ -0,0 +1,191 @@
+import os
+import time
+from typing import Dict, List, Tuple
+
+# 临时文件后缀，文件名形如 .<目标文件名>.<随机串>.tmp
+TEMP_SUFFIX = ".tmp"
+
+
+class StrmWriter:
+    """
+    strm文件写入器
+    direct: 直接覆盖写入目标文件
+    atomic: 先写入同目录临时文件，再rename覆盖目标文件，不会留下写了一半的strm文件
+    durable: 在atomic基础上保证落盘，临时文件写入后各自fdatasync，rename推迟到commit时批量执行，
+             每批次每个目录只fsync一次
+    """
+
+    MODE_DIRECT = "direct"
+    MODE_ATOMIC = "atomic"
+    MODE_DURABLE = "durable"
+    MODES = (MODE_DIRECT, MODE_ATOMIC, MODE_DURABLE)
+
+    def __init__(self, mode: str = MODE_ATOMIC, batch_size: int = 200):
+        """
+        :param mode: 写入模式
+        :param batch_size: durable模式下暂存多少个文件后自动提交，0表示只在调用commit时提交
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"不支持的写入模式: {mode}")
+        self.mode = mode
+        self.batch_size = max(0, batch_size)
+        # durable模式下已写入但未提交的 (临时文件, 目标文件)
+        self._staged: List[Tuple[str, str]] = []
+        # 统计信息，便于对比各模式开销
+        self.stats: Dict[str, int] = {"files": 0, "fsync": 0, "dir_fsync": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.commit()
+        return False
+
+    @property
+    def pending(self) -> int:
+        """
+        暂存未提交的文件数
+        """
+        return len(self._staged)
+
+    def write(self, strm_file: str, strm_content: str):
+        """
+        写入strm文件，durable模式下需调用commit后才会出现在目标路径
+        """
+        parent = os.path.dirname(strm_file) or "."
+        os.makedirs(parent, exist_ok=True)
+        if self.mode == self.MODE_DIRECT:
+            with open(strm_file, "w", encoding="utf-8") as f:
+                f.write(strm_content)
+            self.stats["files"] += 1
+            return
+
+        tmp_file = self.__write_temp(parent, strm_file, strm_content)
+        if self.mode == self.MODE_ATOMIC:
+            os.replace(tmp_file, strm_file)
+            self.stats["files"] += 1
+            return
+
+        self._staged.append((tmp_file, strm_file))
+        if self.batch_size and len(self._staged) >= self.batch_size:
+            self.commit()
+
+    def commit(self) -> int:
+        """
+        提交durable模式下暂存的文件：rename到目标路径，每个目录fsync一次
+        :return: fsync的目录数
+        """
+        if not self._staged:
+            return 0
+        staged, self._staged = self._staged, []
+        try:
+            dirs = set()
+            for tmp_file, strm_file in staged:
+                os.replace(tmp_file, strm_file)
+                dirs.add(os.path.dirname(strm_file) or ".")
+                self.stats["files"] += 1
+            for directory in dirs:
+                self.__fsync_dir(directory)
+                self.stats["dir_fsync"] += 1
+            return len(dirs)
+        except Exception:
+            for tmp_file, _ in staged:
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+            raise
+
+    @staticmethod
+    def is_temp_file(name: str) -> bool:
+        """
+        是否为写入器产生的临时文件名
+        """
+        return name.startswith(".") and name.endswith(TEMP_SUFFIX) and ".strm." in name
+
+    @staticmethod
+    def sweep_temp_files(
+        directory: str, files: List[str], max_age: float = 600
+    ) -> Tuple[int, int]:
+        """
+        处理目录中进程崩溃遗留的临时文件，只处理超过max_age秒未修改的文件，避免误删正在写入的文件
+        目标文件不存在且临时文件已完整写入时（如durable模式已落盘但未提交），rename到目标路径，否则删除
+        :param directory: 目录
+        :param files: 目录下的文件名列表，一般来自os.walk
+        :param max_age: 最小文件年龄（秒）
+        :return: (恢复的文件数, 删除的文件数)
+        """
+        recovered = 0
+        removed = 0
+        expire = time.time() - max_age
+        for name in files:
+            if not StrmWriter.is_temp_file(name):
+                continue
+            tmp_file = os.path.join(directory, name)
+            # .<目标文件名>.<随机串>.tmp
+            strm_file = os.path.join(directory, name[1:].rsplit(".", 2)[0])
+            try:
+                if os.path.getmtime(tmp_file) >= expire:
+                    continue
+                if not os.path.exists(strm_file) and StrmWriter.__is_complete(
+                    tmp_file, strm_file
+                ):
+                    os.replace(tmp_file, strm_file)
+                    recovered += 1
+                else:
+                    os.remove(tmp_file)
+                    removed += 1
+            except OSError:
+                continue
+        if recovered:
+            StrmWriter.__fsync_dir(directory)
+        return recovered, removed
+
+    @staticmethod
+    def __is_complete(tmp_file: str, strm_file: str) -> bool:
+        """
+        临时文件内容是否完整：strm内容为 alist_host + 媒体文件路径，
+        完整写入时内容中的文件名与strm文件名一致（仅扩展名不同）
+        """
+        with open(tmp_file, "r", encoding="utf-8") as f:
+            content = f.read().strip()
+        if not content:
+            return False
+        return (
+            os.path.splitext(os.path.basename(content))[0]
+            == os.path.splitext(os.path.basename(strm_file))[0]
+        )
+
+    def __write_temp(self, parent: str, strm_file: str, strm_content: str) -> str:
+        """
+        在目标目录下写入隐藏的临时文件，保证rename在同一文件系统内完成
+        以0666创建，由内核按进程umask确定最终权限，与直接写入一致
+        """
+        tmp_file = os.path.join(
+            parent, f".{os.path.basename(strm_file)}.{os.urandom(4).hex()}{TEMP_SUFFIX}"
+        )
+        fd = os.open(tmp_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(strm_content)
+                if self.mode == self.MODE_DURABLE:
+                    f.flush()
+                    # 只同步本文件的数据，不影响其它文件系统
+                    getattr(os, "fdatasync", os.fsync)(f.fileno())
+                    self.stats["fsync"] += 1
+        except Exception:
+            os.remove(tmp_file)
+            raise
+        return tmp_file
+
+    @staticmethod
+    def __fsync_dir(directory: str):
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            # 部分平台或网络文件系统不支持打开目录
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
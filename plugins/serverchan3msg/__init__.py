@@ -1,10 +1,4 @@
-import hashlib
-from base64 import b64encode
 from typing import Any, List, Dict, Tuple
-from urllib.parse import urlencode
-
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad
 
 from app.core.event import eventmanager, Event
 from app.log import logger
@@ -25,7 +19,7 @@ class ServerChan3Msg(_PluginBase):
     # 插件图标
     plugin_icon = "https://raw.githubusercontent.com/ahjsrhj/MoviePilot-Plugins/main/icons/ServerChan3.png"
     # 插件版本
-    plugin_version = "1.1"
+    plugin_version = "1.2"
     # 插件作者
     plugin_author = "ahjsrhj"
     # 作者主页